@@ -4,14 +4,37 @@ from __future__ import annotations
 import argparse
 import json
 import math
+import multiprocessing
 import os
+import pickle
 import platform
 import re
 import subprocess
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    import simdjson
+except ImportError:  # optional: lazy on-demand parsing of large result files
+    simdjson = None
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib parser
+    orjson = None
+
+# simdjson returns lazy Object/Array proxies rather than dict/list.
+JSON_OBJECT_TYPES: tuple[type, ...] = (dict,)
+JSON_ARRAY_TYPES: tuple[type, ...] = (list,)
+if simdjson is not None:
+    JSON_OBJECT_TYPES += (simdjson.Object,)
+    JSON_ARRAY_TYPES += (simdjson.Array,)
 
 
 def _get_cpu_name() -> str:
@@ -153,6 +176,22 @@ SCENARIO_LABELS: dict[str, str] = {
 }
 
 
+RESULT_FILE_PREFIXES = ("webgl-perf-", "protspace-webgl-perf-suite-")
+
+
+PLOT_FORMATS = ("png", "svg")
+DEFAULT_PNG_DPI = 120
+
+
+# Below this many stale bytes, parsing inline beats starting a process pool.
+PARSE_POOL_MIN_BYTES = 4 * 1024 * 1024
+
+
+# Bump when FileSummary/Stat change shape so stale caches are ignored.
+CACHE_VERSION = 2
+CACHE_FILENAME = ".cache.pkl"
+
+
 BROWSER_STYLES: dict[str, tuple[str, str]] = {
     "chrome": ("Chrome", "#4285F4"),
     "firefox": ("Firefox", "#FF7139"),
@@ -164,12 +203,9 @@ def _scenario_label(name: str) -> str:
     return SCENARIO_LABELS.get(name, name)
 
 
-def _browser_label(name: str) -> str:
-    return BROWSER_STYLES.get(name, (name, "black"))[0]
-
-
-def _browser_color(name: str) -> str:
-    return BROWSER_STYLES.get(name, (name, "black"))[1]
+def _browser_style(name: str) -> tuple[str, str]:
+    """Return ``(label, color)``; unknown browsers use their raw name in black."""
+    return BROWSER_STYLES.get(name, (name, "black"))
 
 
 @dataclass(frozen=True)
@@ -179,6 +215,86 @@ class Stat:
     n: int
 
 
+@dataclass(frozen=True)
+class FileSummary:
+    """Aggregated stats from a single result file, merged into the totals by main()."""
+
+    browser: str
+    records: dict[tuple[str, str, str], Stat]
+    datasets: set[str]
+    dataset_points: dict[str, int]
+
+
+def _empty_grid() -> np.ndarray:
+    import numpy as np  # noqa: PLC0415
+
+    return np.full((0, 0, 0), np.nan)
+
+
+def _intern(ids: dict[str, int], name: str) -> int:
+    code = ids.get(name)
+    if code is None:
+        code = ids[name] = len(ids)
+    return code
+
+
+@dataclass
+class StatGrid:
+    """Dense (scenario, browser, dataset) mean/CI arrays addressed by integer codes.
+
+    Codes are assigned in first-seen order and the arrays grow as new names
+    appear; cells without a record stay NaN.
+    """
+
+    scenario_ids: dict[str, int] = field(default_factory=dict)
+    browser_ids: dict[str, int] = field(default_factory=dict)
+    dataset_ids: dict[str, int] = field(default_factory=dict)
+    means: np.ndarray = field(default_factory=_empty_grid)
+    cis: np.ndarray = field(default_factory=_empty_grid)
+
+    def add(self, summary: FileSummary) -> None:
+        """Merge a file summary; later summaries overwrite earlier cells."""
+        _intern(self.browser_ids, summary.browser)
+        for dataset in summary.datasets:
+            _intern(self.dataset_ids, dataset)
+        cells = [
+            (
+                _intern(self.scenario_ids, scenario),
+                _intern(self.browser_ids, browser),
+                _intern(self.dataset_ids, dataset),
+                stat,
+            )
+            for (scenario, browser, dataset), stat in summary.records.items()
+        ]
+        self._grow()
+        for si, bi, di, stat in cells:
+            self.means[si, bi, di] = stat.mean_ms
+            self.cis[si, bi, di] = stat.ci95_ms
+
+    def take(
+        self, scenarios: Sequence[str], browsers: Sequence[str], datasets: Sequence[str]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(means, cis)`` reordered to the given name sequences."""
+        import numpy as np  # noqa: PLC0415
+
+        index = np.ix_(
+            [self.scenario_ids[s] for s in scenarios],
+            [self.browser_ids[b] for b in browsers],
+            [self.dataset_ids[d] for d in datasets],
+        )
+        return self.means[index], self.cis[index]
+
+    def _grow(self) -> None:
+        import numpy as np  # noqa: PLC0415
+
+        shape = (len(self.scenario_ids), len(self.browser_ids), len(self.dataset_ids))
+        if shape == self.means.shape:
+            return
+        pad = [(0, new - old) for new, old in zip(shape, self.means.shape)]
+        self.means = np.pad(self.means, pad, constant_values=np.nan)
+        self.cis = np.pad(self.cis, pad, constant_values=np.nan)
+
+
 def _parse_dataset_and_browser(file_path: Path) -> tuple[Optional[str], str]:
     name = file_path.name
 
@@ -201,43 +317,419 @@ def _parse_dataset_and_browser(file_path: Path) -> tuple[Optional[str], str]:
     return dataset, browser
 
 
-def _mean_ci95_ms(values: list[float]) -> Stat:
-    n = len(values)
+def _stat_from_moments(n: int, mean: float, m2: float) -> Stat:
+    """Build a Stat from Welford running moments (count, mean, M2)."""
     if n == 0:
         return Stat(mean_ms=float("nan"), ci95_ms=float("nan"), n=0)
-
-    mean = sum(values) / n
     if n == 1:
         return Stat(mean_ms=mean, ci95_ms=0.0, n=1)
 
-    var = sum((x - mean) ** 2 for x in values) / (n - 1)
-    std = math.sqrt(var)
-    sem = std / math.sqrt(n)
+    var = m2 / (n - 1)
+    sem = math.sqrt(var / n)
     ci = 1.96 * sem
     return Stat(mean_ms=mean, ci95_ms=ci, n=n)
 
 
+def _linfit(xs: Sequence[float], ys: Sequence[float]) -> tuple[float, float]:
+    """Least-squares straight-line fit; returns ``(slope, intercept)``.
+
+    Closed form of ``np.polyfit(xs, ys, 1)`` without the SVD setup, which
+    dominates for the handful of points per browser.
+    """
+    import numpy as np  # noqa: PLC0415
+
+    x_arr = np.asarray(xs, dtype=np.float64)
+    y_arr = np.asarray(ys, dtype=np.float64)
+    x_mean = x_arr.mean()
+    y_mean = y_arr.mean()
+    dx = x_arr - x_mean
+    ss_x = (dx * dx).sum()
+    if ss_x == 0:
+        return 0.0, float(y_mean)
+    slope = float((dx * (y_arr - y_mean)).sum() / ss_x)
+    return slope, float(y_mean - slope * x_mean)
+
+
+class _SafeNameTable(dict[int, int | str]):
+    """``str.translate`` table keeping alphanumerics, ``-`` and ``_``; else ``_``.
+
+    Entries are filled lazily so non-ASCII alphanumerics are kept, as before.
+    """
+
+    def __missing__(self, codepoint: int) -> int | str:
+        ch = chr(codepoint)
+        value: int | str = codepoint if ch.isalnum() or ch in "-_" else "_"
+        self[codepoint] = value
+        return value
+
+
+_SAFE_NAME_TABLE = _SafeNameTable()
+
+
+def _parse_formats(value: str) -> tuple[str, ...]:
+    requested = {f.strip().lower() for f in value.split(",") if f.strip()}
+    unknown = requested - set(PLOT_FORMATS)
+    if not requested or unknown:
+        raise argparse.ArgumentTypeError(
+            f"expected a comma-separated subset of {','.join(PLOT_FORMATS)}, got {value!r}"
+        )
+    return tuple(f for f in PLOT_FORMATS if f in requested)
+
+
+def _parse_dpi(value: str) -> int:
+    try:
+        dpi = int(value)
+    except ValueError:
+        dpi = 0
+    if dpi <= 0:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return dpi
+
+
+def _import_pyplot() -> Any:
+    """Import pyplot on the non-interactive Agg backend.
+
+    The script only writes files, so GUI backends (e.g. macOS) and their event
+    loop are skipped even if MPLBACKEND or matplotlibrc selects one. A fixed
+    SVG hash salt keeps generated clip-path ids stable between runs.
+    """
+    import matplotlib  # noqa: PLC0415
+
+    matplotlib.use("Agg")
+    matplotlib.rcParams["svg.hashsalt"] = "protspace-webgl-perf"
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+
+    return plt
+
+
+def _save_figure(
+    fig: Any, output_dir: Path, name: str, formats: Sequence[str], dpi: int
+) -> None:
+    for fmt in formats:
+        if fmt == "png":
+            fig.savefig(output_dir / f"{name}.png", dpi=dpi)
+        else:
+            # Drop the embedded timestamp; with the fixed svg.hashsalt set in
+            # _import_pyplot(), re-runs produce identical SVGs.
+            fig.savefig(output_dir / f"{name}.{fmt}", metadata={"Date": None})
+
+
+@dataclass(frozen=True)
+class PlotContext:
+    """Scenario-independent plot inputs, shipped once with every render job."""
+
+    output_dir: Path
+    formats: tuple[str, ...]
+    dpi: int
+    subtitle: str
+    # (label, color) per browser, in bar/legend order.
+    browser_styles: list[tuple[str, str]]
+    datasets: list[str]
+    # Indices into ``datasets`` with a known size, ordered by size, and those
+    # sizes (the scatter x values). None skips the scatter plots.
+    scatter_order: Optional[np.ndarray]
+    scatter_xs: Optional[np.ndarray]
+
+
+# Figures are reused across the scenarios rendered by one process.
+_figures: dict[str, tuple[Any, Any]] = {}
+
+
+def _cleared_figure(kind: str, figsize: tuple[float, float]) -> tuple[Any, Any]:
+    entry = _figures.get(kind)
+    if entry is None:
+        entry = _figures[kind] = _import_pyplot().subplots(figsize=figsize)
+    else:
+        import matplotlib as mpl  # noqa: PLC0415
+
+        fig, ax = entry
+        ax.clear()
+        # ax.clear() keeps the previous tight_layout() margins; restore the
+        # defaults so a reused figure renders exactly like a fresh one.
+        fig.subplots_adjust(
+            **{
+                k: mpl.rcParams[f"figure.subplot.{k}"]
+                for k in ("left", "right", "bottom", "top")
+            }
+        )
+    return entry
+
+
+def _close_figures() -> None:
+    if _figures:
+        _import_pyplot().close("all")
+        _figures.clear()
+
+
+def _render_scenario(
+    ctx: PlotContext,
+    scenario_name: str,
+    scenario_means: np.ndarray,
+    scenario_cis: np.ndarray,
+) -> None:
+    """Write the bar (and, with dataset sizes, scatter) plots for one scenario.
+
+    ``scenario_means``/``scenario_cis`` are (browser, dataset) matrices.
+    Module-level so it can run in a worker process.
+    """
+    import numpy as np  # noqa: PLC0415
+
+    plt = _import_pyplot()
+    n_browsers = len(ctx.browser_styles)
+    x = np.arange(len(ctx.datasets))
+    bar_width = 0.8 / max(1, n_browsers)
+
+    fig_bar, ax_bar = _cleared_figure("bar", (12, 6))
+    for i, (label, color) in enumerate(ctx.browser_styles):
+        offsets = x + (i - (n_browsers - 1) / 2) * bar_width
+        ax_bar.bar(
+            offsets,
+            scenario_means[i],
+            bar_width,
+            label=label,
+            yerr=scenario_cis[i],
+            capsize=3,
+            color=color,
+        )
+
+    fig_bar.suptitle(f"WebGL render perf: {_scenario_label(scenario_name)}", y=0.98)
+    ax_bar.set_title(ctx.subtitle, fontsize=10, pad=2)
+    ax_bar.set_ylabel("Render time per pass (ms)")
+    ax_bar.set_xticks(x)
+    ax_bar.set_xticklabels(ctx.datasets)
+
+    plt.setp(ax_bar.get_xticklabels(), rotation=45, ha="right", rotation_mode="anchor")
+    ax_bar.legend(title="Browser", ncol=3, fontsize=9)
+    ax_bar.grid(axis="y", alpha=0.2)
+
+    fig_bar.tight_layout(rect=[0, 0, 1, 0.96])
+
+    safe_name = scenario_name.translate(_SAFE_NAME_TABLE)
+    _save_figure(fig_bar, ctx.output_dir, safe_name, ctx.formats, ctx.dpi)
+
+    if ctx.scatter_order is None or ctx.scatter_xs is None:
+        return
+
+    fig_sc, ax_sc = _cleared_figure("scatter", (10, 6))
+    scatter_means = scenario_means[:, ctx.scatter_order]
+    scatter_cis = scenario_cis[:, ctx.scatter_order]
+    for i, (label, color) in enumerate(ctx.browser_styles):
+        valid = np.isfinite(scatter_means[i])
+        if not valid.any():
+            continue
+        xs = ctx.scatter_xs[valid]
+        ys = scatter_means[i, valid]
+        yerr = scatter_cis[i, valid]
+        ax_sc.errorbar(
+            xs,
+            ys,
+            yerr=yerr,
+            fmt="o",
+            capsize=3,
+            label=label,
+            color=color,
+            ecolor=color,
+        )
+
+        if len(xs) >= 2:
+            slope, intercept = _linfit(xs, ys)
+            x_line = np.linspace(xs[0], xs[-1], 100)
+            y_line = slope * x_line + intercept
+            ax_sc.plot(
+                x_line,
+                y_line,
+                linestyle="--",
+                linewidth=1,
+                color=color,
+                alpha=0.7,
+            )
+
+    fig_sc.suptitle(
+        f"Dataset size vs render time: {_scenario_label(scenario_name)}", y=0.98
+    )
+    ax_sc.set_title(ctx.subtitle, fontsize=10, pad=2)
+    ax_sc.set_xlabel("Dataset size (number of points)")
+    ax_sc.set_ylabel("Render time per pass (ms)")
+    ax_sc.legend(title="Browser")
+    ax_sc.grid(axis="both", alpha=0.2)
+
+    fig_sc.tight_layout(rect=[0, 0, 1, 0.96])
+    _save_figure(fig_sc, ctx.output_dir, f"scatter-{safe_name}", ctx.formats, ctx.dpi)
+
+
 def _iter_result_files(input_dir: Path) -> Iterable[Path]:
-    files: set[Path] = set()
-    files.update(input_dir.rglob("webgl-perf-*.json"))
-    files.update(input_dir.rglob("protspace-webgl-perf-suite-*.json"))
+    files: list[Path] = []
+    for dirpath, _, filenames in os.walk(input_dir):
+        for name in filenames:
+            if name.endswith(".json") and name.startswith(RESULT_FILE_PREFIXES):
+                files.append(Path(dirpath, name))
     yield from sorted(files)
 
 
-def _iter_dataset_payloads(payload: Any) -> Iterable[dict[str, Any]]:
-    if not isinstance(payload, dict):
+_simdjson_parser: Any = None
+
+
+def _parse_json(raw: bytes) -> Any:
+    """Parse a result file, preferring simdjson, then orjson, then the stdlib.
+
+    simdjson only materializes the fields that are actually read; its proxies
+    borrow the shared parser, so they must not outlive the current file.
+    """
+    global _simdjson_parser
+    if simdjson is not None:
+        if _simdjson_parser is None:
+            _simdjson_parser = simdjson.Parser()
+        return _simdjson_parser.parse(raw)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _iter_dataset_payloads(payload: Any) -> Iterable[Any]:
+    if not isinstance(payload, JSON_OBJECT_TYPES):
         return
 
     results = payload.get("results")
-    if isinstance(results, list):
+    if isinstance(results, JSON_ARRAY_TYPES):
         for entry in results:
-            if isinstance(entry, dict):
+            if isinstance(entry, JSON_OBJECT_TYPES):
                 yield entry
         return
 
     yield payload
 
 
+# Raised when a pass field is missing or not a number.
+NOT_NUMERIC = (KeyError, TypeError, ValueError, OverflowError)
+
+
+def _summarize_file(file_path: Path) -> FileSummary:
+    dataset_from_name, browser = _parse_dataset_and_browser(file_path)
+    raw = file_path.read_bytes()
+    records: dict[tuple[str, str, str], Stat] = {}
+    datasets: set[str] = set()
+    dataset_points: dict[str, int] = {}
+
+    for payload in _iter_dataset_payloads(_parse_json(raw)):
+        dataset: Optional[str] = dataset_from_name
+        ds = payload.get("dataset")
+        if isinstance(ds, JSON_OBJECT_TYPES):
+            ds_id = ds.get("id")
+            if isinstance(ds_id, str) and ds_id:
+                dataset = ds_id
+        if not dataset:
+            dataset = "unknown"
+        datasets.add(dataset)
+
+        for scenario in payload.get("scenarios", []):
+            scenario_name = scenario.get("name")
+            if not scenario_name:
+                continue
+            max_rp = -1
+            # Welford's online mean/variance; no per-scenario durations list.
+            n = 0
+            mean = 0.0
+            m2 = 0.0
+            for pass_ in scenario.get("passes") or ():
+                try:
+                    rp = float(pass_["renderedPoints"])
+                except NOT_NUMERIC:
+                    pass
+                else:
+                    # int() would truncate 4999.9; only whole counts are kept.
+                    if rp.is_integer() and rp > max_rp:
+                        max_rp = int(rp)
+                try:
+                    d = float(pass_["durationMs"])
+                except NOT_NUMERIC:
+                    continue
+                n += 1
+                delta = d - mean
+                mean += delta / n
+                m2 += delta * (d - mean)
+            if max_rp >= 0:
+                dataset_points[dataset] = max(dataset_points.get(dataset, 0), max_rp)
+            records[(scenario_name, browser, dataset)] = _stat_from_moments(n, mean, m2)
+
+    return FileSummary(
+        browser=browser,
+        records=records,
+        datasets=datasets,
+        dataset_points=dataset_points,
+    )
+
+
+# (st_mtime_ns, st_size, summary) keyed by resolved file path.
+SummaryCache = dict[str, tuple[int, int, FileSummary]]
+
+
+def _load_cache(cache_path: Path) -> SummaryCache:
+    try:
+        with cache_path.open("rb") as f:
+            payload = pickle.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as exc:
+        print(
+            f"warning: ignoring unreadable cache {cache_path}: {exc}", file=sys.stderr
+        )
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != CACHE_VERSION:
+        return {}
+    return payload["files"]
+
+
+def _save_cache(cache_path: Path, cache: SummaryCache) -> None:
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    with tmp_path.open("wb") as f:
+        pickle.dump(
+            {"version": CACHE_VERSION, "files": cache},
+            f,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    os.replace(tmp_path, cache_path)
+
+
+def _summarize_files(paths: Sequence[Path], cache: SummaryCache) -> list[FileSummary]:
+    """Summarize result files in path order, reusing cache entries for unchanged files.
+
+    ``cache`` is updated in place and pruned to ``paths``.
+    """
+    summaries: dict[Path, FileSummary] = {}
+    stale: list[tuple[Path, str, int, int]] = []
+    for p in paths:
+        key = str(p.resolve())
+        st = p.stat()
+        cached = cache.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            summaries[p] = cached[2]
+        else:
+            stale.append((p, key, st.st_mtime_ns, st.st_size))
+
+    # Parsing is CPU-bound, so spread large batches of stale files over worker
+    # processes. Typical suites are a few KB, where pool startup (a re-import
+    # per worker under spawn) costs far more than parsing inline. Pool.map keeps
+    # results in path order.
+    stale_paths = [p for p, *_ in stale]
+    stale_bytes = sum(size for *_, size in stale)
+    workers = min(os.cpu_count() or 1, len(stale_paths))
+    if workers > 1 and stale_bytes >= PARSE_POOL_MIN_BYTES:
+        with multiprocessing.Pool(workers) as pool:
+            fresh = pool.map(_summarize_file, stale_paths)
+    else:
+        fresh = [_summarize_file(p) for p in stale_paths]
+
+    for (p, key, mtime_ns, size), summary in zip(stale, fresh):
+        summaries[p] = summary
+        cache[key] = (mtime_ns, size, summary)
+
+    live_keys = {str(p.resolve()) for p in paths}
+    for key in cache.keys() - live_keys:
+        del cache[key]
+
+    return [summaries[p] for p in paths]
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Plot ProtSpace WebGL perf JSON results."
@@ -250,59 +742,59 @@ def main() -> int:
         default=None,
         help="Custom subtitle for plots (default: auto-detect CPU, GPU, RAM)",
     )
+    parser.add_argument(
+        "--formats",
+        type=_parse_formats,
+        default=PLOT_FORMATS,
+        help="Comma-separated image formats to write (default: png,svg)",
+    )
+    parser.add_argument(
+        "--dpi",
+        type=_parse_dpi,
+        default=DEFAULT_PNG_DPI,
+        help=f"Resolution of PNG output (default: {DEFAULT_PNG_DPI})",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Reuse parsed results for unchanged files via <output>/{CACHE_FILENAME}",
+    )
     args = parser.parse_args()
 
     input_dir = args.input
     output_dir = args.output
+    formats: tuple[str, ...] = args.formats
+    dpi: int = args.dpi
     plot_subtitle = args.subtitle if args.subtitle else _detect_machine_subtitle()
     print(f"Plot subtitle: {plot_subtitle}")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    records: dict[tuple[str, str, str], Stat] = {}
-    datasets: set[str] = set()
-    browsers: set[str] = set()
-    scenarios: set[str] = set()
-    dataset_points: dict[str, int] = {}
+    cache_path = output_dir / CACHE_FILENAME
+    cache = _load_cache(cache_path) if args.cache else {}
+    paths = list(_iter_result_files(input_dir))
+    summaries = _summarize_files(paths, cache)
 
-    for p in _iter_result_files(input_dir):
-        dataset_from_name, browser = _parse_dataset_and_browser(p)
-        browsers.add(browser)
-
-        with p.open("r", encoding="utf-8") as f:
-            file_payload = json.load(f)
-
-        for payload in _iter_dataset_payloads(file_payload):
-            dataset: Optional[str] = dataset_from_name
-            ds = payload.get("dataset")
-            if isinstance(ds, dict):
-                ds_id = ds.get("id")
-                if isinstance(ds_id, str) and ds_id:
-                    dataset = ds_id
-            if not dataset:
-                dataset = "unknown"
-            datasets.add(dataset)
-
-            for scenario in payload.get("scenarios", []):
-                scenario_name = scenario.get("name")
-                if not scenario_name:
-                    continue
-                scenarios.add(scenario_name)
-                for pass_ in scenario.get("passes") or []:
-                    rp = pass_.get("renderedPoints")
-                    if isinstance(rp, int) and rp >= 0:
-                        dataset_points[dataset] = max(
-                            dataset_points.get(dataset, 0), rp
-                        )
-                durations = [
-                    float(pass_.get("durationMs"))
-                    for pass_ in (scenario.get("passes") or [])
-                    if isinstance(pass_.get("durationMs"), (int, float))
-                ]
-                records[(scenario_name, browser, dataset)] = _mean_ci95_ms(durations)
+    if args.cache:
+        _save_cache(cache_path, cache)
 
-    if not records:
+    # Bail out before numpy/matplotlib are imported.
+    if not any(summary.records for summary in summaries):
         raise SystemExit(f"No perf JSON files found under {input_dir.resolve()}")
 
+    import numpy as np
+
+    grid = StatGrid()
+    dataset_points: dict[str, int] = {}
+    # Summaries come back in path order, so later files still win on duplicate keys.
+    for summary in summaries:
+        grid.add(summary)
+        for dataset, n_points in summary.dataset_points.items():
+            dataset_points[dataset] = max(dataset_points.get(dataset, 0), n_points)
+
+    browsers = grid.browser_ids.keys()
+    datasets = grid.dataset_ids.keys()
+    scenarios = grid.scenario_ids.keys()
+
     browser_order = ["chrome", "firefox", "safari"]
     browsers_sorted = [b for b in browser_order if b in browsers] + sorted(
         browsers - set(browser_order)
@@ -329,117 +821,71 @@ def main() -> int:
             file=sys.stderr,
         )
 
-    import numpy as np
-    import matplotlib.pyplot as plt
-
-    x = np.arange(len(datasets_sorted))
-    bar_width = 0.8 / max(1, len(browsers_sorted))
-
     scenario_order = ["annotationChange", "zoomInOut", "dragCanvas", "clickPoint"]
     scenarios_sorted = [s for s in scenario_order if s in scenarios] + sorted(
         scenarios - set(scenario_order)
     )
 
-    for scenario_name in scenarios_sorted:
-        fig, ax = plt.subplots(figsize=(12, 6))
-
-        for i, browser in enumerate(browsers_sorted):
-            offsets = x + (i - (len(browsers_sorted) - 1) / 2) * bar_width
-            means: list[float] = []
-            cis: list[float] = []
-            for dataset in datasets_sorted:
-                stat = records.get((scenario_name, browser, dataset))
-                if stat is None:
-                    means.append(float("nan"))
-                    cis.append(float("nan"))
-                else:
-                    means.append(stat.mean_ms)
-                    cis.append(stat.ci95_ms)
-
-            ax.bar(
-                offsets,
-                means,
-                bar_width,
-                label=_browser_label(browser),
-                yerr=cis,
-                capsize=3,
-                color=_browser_color(browser),
-            )
-
-        fig.suptitle(f"WebGL render perf: {_scenario_label(scenario_name)}", y=0.98)
-        ax.set_title(plot_subtitle, fontsize=10, pad=2)
-        ax.set_ylabel("Render time per pass (ms)")
-        ax.set_xticks(x)
-        ax.set_xticklabels(datasets_sorted)
-
-        plt.setp(ax.get_xticklabels(), rotation=45, ha="right", rotation_mode="anchor")
-        ax.legend(title="Browser", ncol=3, fontsize=9)
-        ax.grid(axis="y", alpha=0.2)
-
-        fig.tight_layout(rect=[0, 0, 1, 0.96])
+    means, cis = grid.take(scenarios_sorted, browsers_sorted, datasets_sorted)
 
-        safe_name = "".join(
-            c if c.isalnum() or c in ("-", "_") else "_" for c in scenario_name
+    scatter_order: Optional[np.ndarray] = None
+    scatter_xs: Optional[np.ndarray] = None
+    if dataset_points:
+        dataset_sizes = np.fromiter(
+            (dataset_points.get(d, np.nan) for d in datasets_sorted),
+            dtype=np.float64,
+            count=len(datasets_sorted),
         )
-        fig.savefig(output_dir / f"{safe_name}.png", dpi=200)
-        fig.savefig(output_dir / f"{safe_name}.svg")
-        plt.close(fig)
-
-        if dataset_points:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            for browser in browsers_sorted:
-                pts: list[tuple[float, float, float]] = []
-                for dataset in datasets_sorted:
-                    n_points = dataset_points.get(dataset)
-                    stat = records.get((scenario_name, browser, dataset))
-                    if n_points is None or stat is None:
-                        continue
-                    pts.append((float(n_points), stat.mean_ms, stat.ci95_ms))
-
-                pts.sort(key=lambda t: t[0])
-                if not pts:
-                    continue
-                xs = [t[0] for t in pts]
-                ys = [t[1] for t in pts]
-                yerr = [t[2] for t in pts]
-                color = _browser_color(browser)
-                ax.errorbar(
-                    xs,
-                    ys,
-                    yerr=yerr,
-                    fmt="o",
-                    capsize=3,
-                    label=_browser_label(browser),
-                    color=color,
-                    ecolor=color,
-                )
-
-                if len(xs) >= 2:
-                    coeffs = np.polyfit(xs, ys, 1)
-                    x_line = np.linspace(min(xs), max(xs), 100)
-                    y_line = coeffs[0] * x_line + coeffs[1]
-                    ax.plot(
-                        x_line,
-                        y_line,
-                        linestyle="--",
-                        linewidth=1,
-                        color=color,
-                        alpha=0.7,
-                    )
+        order = np.argsort(dataset_sizes, kind="stable")
+        scatter_order = order[np.isfinite(dataset_sizes[order])]
+        scatter_xs = dataset_sizes[scatter_order]
+
+    ctx = PlotContext(
+        output_dir=output_dir,
+        formats=formats,
+        dpi=dpi,
+        subtitle=plot_subtitle,
+        browser_styles=[_browser_style(b) for b in browsers_sorted],
+        datasets=datasets_sorted,
+        scatter_order=scatter_order,
+        scatter_xs=scatter_xs,
+    )
 
-            fig.suptitle(
-                f"Dataset size vs render time: {_scenario_label(scenario_name)}", y=0.98
+    # Scenarios whose names sanitize to the same file name would overwrite each
+    # other. Render only the last of them, as the serial loop's final write
+    # did, so concurrent workers cannot race on the same output path.
+    last_by_file: dict[str, int] = {}
+    for si, name in enumerate(scenarios_sorted):
+        last_by_file[name.translate(_SAFE_NAME_TABLE)] = si
+    render_indices = sorted(last_by_file.values())
+    for si, name in enumerate(scenarios_sorted):
+        kept = last_by_file[name.translate(_SAFE_NAME_TABLE)]
+        if kept != si:
+            print(
+                f"warning: scenario {name!r} shares a plot file name with "
+                f"{scenarios_sorted[kept]!r}; skipping it",
+                file=sys.stderr,
             )
-            ax.set_title(plot_subtitle, fontsize=10, pad=2)
-            ax.set_xlabel("Dataset size (number of points)")
-            ax.set_ylabel("Render time per pass (ms)")
-            ax.legend(title="Browser")
-            ax.grid(axis="both", alpha=0.2)
-
-            fig.tight_layout(rect=[0, 0, 1, 0.96])
-            fig.savefig(output_dir / f"scatter-{safe_name}.png", dpi=200)
-            fig.savefig(output_dir / f"scatter-{safe_name}.svg")
-            plt.close(fig)
+
+    # Scenarios render independently and Agg rasterization dominates, so fan
+    # them out over processes. A single scenario is rendered inline. Reused
+    # figures are fully reset per scenario (see _cleared_figure), so output
+    # does not depend on which worker rendered what, or in which order.
+    workers = min(os.cpu_count() or 1, len(render_indices))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    _render_scenario, ctx, scenarios_sorted[si], means[si], cis[si]
+                )
+                for si in render_indices
+            ]
+            for future in futures:
+                future.result()
+    else:
+        for si in render_indices:
+            _render_scenario(ctx, scenarios_sorted[si], means[si], cis[si])
+        _close_figures()
 
     print(f"Wrote plots to: {output_dir.resolve()}")
     return 0